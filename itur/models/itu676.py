@@ -5,54 +5,70 @@ from __future__ import print_function
 
 import os
 import warnings
-
+from functools import lru_cache
 
 import numpy as np
 from astropy import units as u
 
 from itur.models.itu453 import radio_refractive_index
+from itur.models.itu453 import get_version as get_version_453
 from itur.models.itu835 import (standard_pressure, standard_temperature,
                                 standard_water_vapour_density)
+from itur.models.itu835 import get_version as get_version_835
 from itur.models.itu836 import total_water_vapour_content
 from itur.models.itu1511 import topographic_altitude
 from itur.utils import (prepare_quantity, prepare_output_array, get_input_type,
                         prepare_input_array, load_data, dataset_dir)
 
 
+def __load_lines__(filename):
+    # Read a table of spectroscopic lines and return its columns (line
+    # frequency followed by the line coefficients) as contiguous arrays, so
+    # that the line-by-line sums do not operate on strided column views.
+    data = load_data(os.path.join(dataset_dir, '676', filename),
+                     skip_header=1)
+    return np.ascontiguousarray(data.T, dtype=np.float64)
+
+
 def __gamma0_exact__(self, f, p, rho, T):
     # T in Kelvin
     # e : water vapour partial pressure in hPa (total barometric pressure
     # ptot = p + e)
+    # The inputs are broadcast against each other, and the spectral lines
+    # are placed along an additional trailing axis that is summed in Eq. 1
+    f, p, rho, T = (np.asarray(x)[..., np.newaxis] for x in (f, p, rho, T))
     theta = 300 / T
+    theta_08 = theta**0.8
     e = rho * T / 216.7
 
     f_ox = self.f_ox
+    f_minus = f_ox - f
+    f_plus = f_ox + f
 
-    D_f_ox = self.a3 * 1e-4 * (p * (theta ** (0.8 - self.a4)) +
+    D_f_ox = self.a3 * 1e-4 * (p * theta ** (0.8 - self.a4) +
                                1.1 * e * theta)
 
-    D_f_ox = np.sqrt(D_f_ox**2 + 2.25e-6)
+    D_f_ox_2 = D_f_ox**2 + 2.25e-6
+    D_f_ox = np.sqrt(D_f_ox_2)
 
-    delta_ox = (self.a5 + self.a6 * theta) * 1e-4 * (p + e) * theta**0.8
+    delta_ox = (self.a5 + self.a6 * theta) * 1e-4 * (p + e) * theta_08
 
-    F_i_ox = f / f_ox * ((D_f_ox - delta_ox * (f_ox - f)) /
-                         ((f_ox - f) ** 2 + D_f_ox ** 2) +
-                         (D_f_ox - delta_ox * (f_ox + f)) /
-                         ((f_ox + f) ** 2 + D_f_ox ** 2))
+    F_i_ox = f / f_ox * ((D_f_ox - delta_ox * f_minus) /
+                         (f_minus ** 2 + D_f_ox_2) +
+                         (D_f_ox - delta_ox * f_plus) /
+                         (f_plus ** 2 + D_f_ox_2))
 
     Si_ox = self.a1 * 1e-7 * p * theta**3 * np.exp(self.a2 * (1 - theta))
 
-    N_pp_ox = Si_ox * F_i_ox
-
-    d = 5.6e-4 * (p + e) * theta**0.8
+    d = 5.6e-4 * (p + e) * theta_08
 
     N_d_pp = f * p * theta**2 * \
         (6.14e-5 / (d * (1 + (f / d)**2)) +
          1.4e-12 * p * theta**1.5 / (1 + 1.9e-5 * f**1.5))
 
-    N_pp = N_pp_ox.sum() + N_d_pp
+    N_pp = np.einsum('...i,...i->...', Si_ox, F_i_ox) + N_d_pp[..., 0]
 
-    gamma = 0.1820 * f * N_pp           # Eq. 1 [dB/km]
+    gamma = 0.1820 * f[..., 0] * N_pp   # Eq. 1 [dB/km]
     return gamma
 
 
@@ -60,6 +76,9 @@ def __gammaw_exact__(self, f, p, rho, T):
     # T in Kelvin
     # e : water vapour partial pressure in hPa (total barometric pressure
     # ptot = p + e)
+    # The inputs are broadcast against each other, and the spectral lines
+    # are placed along an additional trailing axis that is summed in Eq. 1
+    f, p, rho, T = (np.asarray(x)[..., np.newaxis] for x in (f, p, rho, T))
     theta = 300 / T
     e = rho * T / 216.7
 
@@ -70,20 +89,131 @@ def __gammaw_exact__(self, f, p, rho, T):
 
     D_f_wv = 0.535 * D_f_wv + \
         np.sqrt(0.217 * D_f_wv**2 + 2.1316e-12 * f_wv**2 / theta)
+    D_f_wv_2 = D_f_wv**2
 
-    F_i_wv = f / f_wv * ((D_f_wv) / ((f_wv - f)**2 + D_f_wv**2) +
-                         (D_f_wv) / ((f_wv + f)**2 + D_f_wv**2))
+    F_i_wv = f / f_wv * (D_f_wv / ((f_wv - f)**2 + D_f_wv_2) +
+                         D_f_wv / ((f_wv + f)**2 + D_f_wv_2))
 
     Si_wv = self.b1 * 1e-1 * e * theta**3.5 * np.exp(self.b2 * (1 - theta))
 
-    N_pp_wv = Si_wv * F_i_wv
+    N_pp = np.einsum('...i,...i->...', Si_wv, F_i_wv)
 
-    N_pp = N_pp_wv.sum()
-
-    gamma = 0.1820 * f * N_pp           # Eq. 1 [dB/km]
+    gamma = 0.1820 * f[..., 0] * N_pp   # Eq. 1 [dB/km]
     return gamma
 
 
+def __approximation_warnings__(f, el):
+    # Warn if the approximate method is used outside its range of validity
+    if np.any(f > 350):
+        warnings.warn(
+            RuntimeWarning(
+                'The approximated method to computes '
+                'the gaseous attenuation in recommendation ITU-P 676-11 '
+                'is only recommended for frequencies below 350GHz'))
+
+    # Both conditions on the elevation angle are checked in a single pass
+    el = np.asarray(el)
+    if np.any((el < 5) | (np.mod(el, 90) < 5)):
+        warnings.warn(
+            RuntimeWarning(
+                'The approximated method to compute '
+                'the gaseous attenuation in recommendation ITU-P 676-11 '
+                'is only recommended for elevation angles between '
+                '5 and 90 degrees'))
+
+
+@lru_cache(maxsize=1024)
+def __cached_slant_path_zenith_terms__(self, f, rho, P, T):
+    return self.slant_path_zenith_terms(f, rho, P, T)
+
+
+def __slant_path_zenith_terms__(self, f, rho, P, T):
+    # The terms of the approximate slant path method that do not depend on
+    # the elevation angle are cached for sweeps over elevation angles. The
+    # cache needs hashable arguments, so it is only used for scalar inputs.
+    if all(np.ndim(x) == 0 for x in (f, rho, P, T)):
+        return __cached_slant_path_zenith_terms__(
+            self, float(f), float(rho), float(P), float(T))
+    return self.slant_path_zenith_terms(f, rho, P, T)
+
+
+@lru_cache(maxsize=None)
+def __slant_path_layers__(version_835):
+    # Thickness, height, temperature, pressure and radius of the 922 layers
+    # used by the exact slant path method. They do not depend on the inputs,
+    # so they are computed only once for each version of ITU-R P.835.
+    delta_h = 0.0001 * np.exp((np.arange(0, 922)) / 100)             # Eq. 14
+    h_n = 0.0001 * ((np.exp(np.arange(0, 922) / 100.0) -
+                     1.0) / (np.exp(1.0 / 100.0) - 1.0))             # Eq. 15
+    T_n = standard_temperature(h_n).to(u.K).value
+    press_n = standard_pressure(h_n).value
+    r_n = 6371 + h_n
+    return delta_h, h_n, T_n, press_n, r_n
+
+
+def __compute_slant_path_profile__(self, f, rho, version_835, version_453):
+    # Refractive index and specific attenuation of each of the layers used
+    # by the exact slant path method
+    delta_h, h_n, T_n, press_n, r_n = __slant_path_layers__(version_835)
+    rho_n = standard_water_vapour_density(h_n, rho_0=rho).value
+
+    e_n = rho_n * T_n / 216.7
+    n_n = radio_refractive_index(press_n, e_n, T_n).value
+
+    # The specific attenuation of every layer is computed in a single call
+    gamma_n = self.gamma_exact(f, press_n, rho_n, T_n)
+    return n_n, gamma_n
+
+
+@lru_cache(maxsize=1024)
+def __cached_slant_path_profile__(self, f, rho, version_835, version_453):
+    return __compute_slant_path_profile__(self, f, rho, version_835,
+                                          version_453)
+
+
+def __slant_path_profile__(self, f, rho, version_835, version_453):
+    # The layer profile does not depend on the elevation angle, so it is
+    # cached for sweeps over elevation angles. The cache needs hashable
+    # arguments, so it is only used for scalar inputs.
+    if np.ndim(f) == 0 and np.ndim(rho) == 0:
+        return __cached_slant_path_profile__(
+            self, float(f), float(rho), version_835, version_453)
+    return __compute_slant_path_profile__(self, f, rho, version_835,
+                                          version_453)
+
+
+def __gaseous_attenuation_slant_path_exact__(self, f, el, rho):
+    # Slant path attenuation computed by summation over the 922 layers of the
+    # standard atmosphere (Section 2.2 of Annex 1).
+    version_835 = get_version_835()
+    delta_h, h_n, T_n, press_n, r_n = __slant_path_layers__(version_835)
+    n_n, gamma_n = __slant_path_profile__(self, f, rho, version_835,
+                                          get_version_453())
+
+    # Combining the law of sines in the triangle of each layer (Eq. 18a)
+    # with Snell's law at each boundary (Eq. 19a) shows that the product
+    # n_n * r_n * sin(beta_n) is constant along the path. The angle of
+    # incidence of every layer is therefore obtained directly, instead of
+    # tracing the ray one layer at a time. The layers are placed along an
+    # additional trailing axis, so that el can be an array.
+    el = np.deg2rad(np.asarray(el, dtype=float))[..., np.newaxis]
+    sin_b = n_n[0] * r_n[0] * np.cos(el) / (n_n * r_n)
+    cos_b = np.sqrt(1 - sin_b**2)
+    # beta_1 = 90 - el, which keeps its sign for negative elevation angles
+    cos_b[..., 0] = np.sin(el[..., 0])
+
+    # Eq. 17, a_n = -r_n cos(beta_n) + sqrt(r_n^2 cos^2(beta_n) + s_n), is
+    # the difference of two terms of the order of the Earth radius, so it
+    # is rewritten as s_n / (sqrt(...) + r_n cos(beta_n)) whenever the
+    # cosine is positive to avoid losing precision to cancellation
+    s_n = 2 * r_n * delta_h + delta_h**2
+    q_n = np.sqrt(r_n**2 * cos_b**2 + s_n)
+    a_n = np.where(cos_b > 0, s_n / (q_n + r_n * cos_b), q_n - r_n * cos_b)
+
+    Agas = np.sum(a_n * gamma_n, axis=-1)                            # Eq. 13
+    return Agas
+
+
 class __ITU676__():
     """Attenuation by atmospheric gases.
 
@@ -108,34 +238,7 @@ class __ITU676__():
     # ITU-R P.676 recommendation.
 
     def __init__(self, version=12):
-        if version == 12:
-            self.instance = _ITU676_12_()
-        elif version == 11:
-            self.instance = _ITU676_11_()
-        elif version == 10:
-            self.instance = _ITU676_10_()
-        elif version == 9:
-            self.instance = _ITU676_9_()
-#        elif version == 8:
-#            self.instance = _ITU676_8()
-#        elif version == 7:
-#            self.instance = _ITU676_7()
-#        elif version == 6:
-#            self.instance = _ITU676_6()
-#        elif version == 5:
-#            self.instance = _ITU676_5()
-#        elif version == 4:
-#            self.instance = _ITU676_4()
-#        elif version == 3:
-#            self.instance = _ITU676_3()
-#        elif version == 2:
-#            self.instance = _ITU676_2()
-#        elif version == 1:
-#            self.instance = _ITU676_1()
-        else:
-            raise ValueError(
-                f"Version {version} is not implemented for the ITU-R P.676 model."
-            )
+        self.instance = __get_version_instance__(version)
 
     @property
     def __version__(self):
@@ -159,9 +262,8 @@ class __ITU676__():
         return fcn(f, el, rho, P, T, V_t, h, mode)
 
     def slant_inclined_path_equivalent_height(self, f, P, rho, T):
-        fcn = np.vectorize(self.instance.slant_inclined_path_equivalent_height,
-                           excluded=[0], otypes=[np.ndarray])
-        return np.array(fcn(f, P, rho, T).tolist())
+        return np.array(
+            self.instance.slant_inclined_path_equivalent_height(f, P, rho, T))
 
     def zenit_water_vapour_attenuation(
             self, lat, lon, p, f, V_t=None, h=None):
@@ -174,83 +276,61 @@ class __ITU676__():
     def gamma_exact(self, f, p, rho, t):
         # Abstract method to compute the specific attenuation using the
         # line-by-line method
-        fcn = np.vectorize(self.instance.gamma_exact)
-        return fcn(f, p, rho, t)
+        return self.instance.gamma_exact(f, p, rho, t)
 
     def gammaw_exact(self, f, p, rho, t):
         # Abstract method to compute the specific attenuation due to water
         # vapour
-        fcn = np.vectorize(self.instance.gammaw_exact)
-        return fcn(f, p, rho, t)
+        return self.instance.gammaw_exact(f, p, rho, t)
 
     def gamma0_exact(self, f, p, rho, t):
         # Abstract method to compute the specific attenuation due to dry
         # atmoshere
-        fcn = np.vectorize(self.instance.gamma0_exact)
-        return fcn(f, p, rho, t)
+        return self.instance.gamma0_exact(f, p, rho, t)
 
     def gammaw_approx(self, f, p, rho, t):
         # Abstract method to compute the specific attenuation due to water
         # vapour
-        fcn = np.vectorize(self.instance.gammaw_approx)
         with np.errstate(invalid='ignore'):
-            return fcn(f, p, rho, t)
+            return self.instance.gammaw_approx(f, p, rho, t)
 
     def gamma0_approx(self, f, p, rho, t):
         # Abstract method to compute the specific attenuation due to dry
         # atmoshere
-        fcn = np.vectorize(self.instance.gamma0_approx)
         with np.errstate(invalid='ignore'):
-            return fcn(f, p, rho, t)
+            return self.instance.gamma0_approx(f, p, rho, t)
 
 
 class _ITU676_12_():
 
-    tmp = load_data(os.path.join(dataset_dir, '676/v12_lines_oxygen.txt'),
-                    skip_header=1)
-    f_ox = tmp[:, 0]
-    a1 = tmp[:, 1]
-    a2 = tmp[:, 2]
-    a3 = tmp[:, 3]
-    a4 = tmp[:, 4]
-    a5 = tmp[:, 5]
-    a6 = tmp[:, 6]
-
-    tmp = load_data(os.path.join(dataset_dir,
-                                 '676//v12_lines_water_vapour.txt'),
-                    skip_header=1)
-    f_wv = tmp[:, 0]
-    b1 = tmp[:, 1]
-    b2 = tmp[:, 2]
-    b3 = tmp[:, 3]
-    b4 = tmp[:, 4]
-    b5 = tmp[:, 5]
-    b6 = tmp[:, 6]
+    f_ox, a1, a2, a3, a4, a5, a6 = __load_lines__('v12_lines_oxygen.txt')
+    f_wv, b1, b2, b3, b4, b5, b6 = __load_lines__(
+        'v12_lines_water_vapour.txt')
 
     # Coefficients in table 3
-    t2_coeffs = [(0.1597, 118.750334),
-                 (0.1066, 368.498246),
-                 (0.1325, 424.763020),
-                 (0.1242, 487.249273),
-                 (0.0938, 715.392902),
-                 (0.1448, 773.839490),
-                 (0.1374, 834.145546)]
+    t2_coeffs = np.array([(0.1597, 118.750334),
+                          (0.1066, 368.498246),
+                          (0.1325, 424.763020),
+                          (0.1242, 487.249273),
+                          (0.0938, 715.392902),
+                          (0.1448, 773.839490),
+                          (0.1374, 834.145546)])
 
     # Coefficients in table 4
-    hw_coeffs = [(22.23508, 1.52, 2.56),
-                 (183.310087, 7.62, 10.2),
-                 (325.152888, 1.56, 2.7),
-                 (380.197353, 4.15, 5.7),
-                 (439.150807, 0.2, 0.91),
-                 (448.001085, 1.63, 2.46),
-                 (474.689092, 0.76, 2.22),
-                 (488.490108, 0.26, 2.49),
-                 (556.935985, 7.81, 10),
-                 (620.70087, 1.25, 2.35),
-                 (752.033113, 16.2, 20),
-                 (916.171582, 1.47, 2.58),
-                 (970.315022, 1.36, 2.44),
-                 (987.926764, 1.6, 1.86)]
+    hw_coeffs = np.array([(22.23508, 1.52, 2.56),
+                          (183.310087, 7.62, 10.2),
+                          (325.152888, 1.56, 2.7),
+                          (380.197353, 4.15, 5.7),
+                          (439.150807, 0.2, 0.91),
+                          (448.001085, 1.63, 2.46),
+                          (474.689092, 0.76, 2.22),
+                          (488.490108, 0.26, 2.49),
+                          (556.935985, 7.81, 10),
+                          (620.70087, 1.25, 2.35),
+                          (752.033113, 16.2, 20),
+                          (916.171582, 1.47, 2.58),
+                          (970.315022, 1.36, 2.44),
+                          (987.926764, 1.6, 1.86)])
 
     def __init__(self):
         self.__version__ = 12
@@ -289,20 +369,7 @@ class _ITU676_12_():
 
     @classmethod
     def gaseous_attenuation_approximation(self, f, el, rho, P, T):
-        if np.any(f > 350):
-            warnings.warn(
-                RuntimeWarning(
-                    'The approximated method to computes '
-                    'the gaseous attenuation in recommendation ITU-P 676-11 '
-                    'is only recommended for frequencies below 350GHz'))
-
-        if np.any(5 > el) or np.any(np.mod(el, 90) < 5):
-            warnings.warn(
-                RuntimeWarning(
-                    'The approximated method to compute '
-                    'the gaseous attenuation in recommendation ITU-P 676-11 '
-                    'is only recommended for elevation angles between '
-                    '5 and 90 degrees'))
+        __approximation_warnings__(f, el)
 
         # Water vapour attenuation (gammaw) computation as in Section 1 of
         # Annex 2 of [1]
@@ -322,13 +389,17 @@ class _ITU676_12_():
         t1 = 5.1040 / (1 + 0.066 * rp**-2.3) * \
             np.exp(-((f - 59.7) / (2.87 + 12.4 * np.exp(-7.9 * rp)))**2)
 
-        t2 = sum([(ci * np.exp(2.12 * rp)) /
-                  ((f - fi)**2 + 0.025 * np.exp(2.2 * rp))
-                  for ci, fi in self.t2_coeffs])
+        # The terms of the sums over the lines of tables 3 and 4 are placed
+        # along an additional trailing axis
+        f_l, rp_l = (np.asarray(x)[..., np.newaxis] for x in (f, rp))
+        c_i, f_i = self.t2_coeffs.T
+        t2 = ((c_i * np.exp(2.12 * rp_l)) /
+              ((f_l - f_i)**2 + 0.025 * np.exp(2.2 * rp_l))).sum(axis=-1)
 
+        # The polynomials in f are evaluated using Horner's scheme
         t3 = 0.0114 * f / (1 + 0.14 * rp**-2.6) * \
-            (15.02 * f**2 - 1353 * f + 5.333e4) / \
-            (f**3 - 151.3 * f**2 + 9629 * f - 6803)
+            ((15.02 * f - 1353) * f + 5.333e4) / \
+            (((f - 151.3) * f + 9629) * f - 6803)
 
         A = 0.7832 + 0.00709 * (T - 273.15)
 
@@ -345,8 +416,10 @@ class _ITU676_12_():
         sigmaw = 1.013 / (1 + np.exp(-8.6 * (rp - 0.57)))
 
         # Eq. 35 b
-        hw = A + B * sum([(ai * sigmaw) / ((f - fi)**2 + bi * sigmaw)
-                          for fi, ai, bi in self.hw_coeffs])
+        f_i, a_i, b_i = self.hw_coeffs.T
+        sigmaw_l = np.asarray(sigmaw)[..., np.newaxis]
+        hw = A + B * ((a_i * sigmaw_l) /
+                      ((f_l - f_i)**2 + b_i * sigmaw_l)).sum(axis=-1)
         return h0, hw
 
     @classmethod
@@ -362,16 +435,24 @@ class _ITU676_12_():
             gamma = self.gamma_exact(f, P, rho, T)
             return gamma * r
 
+    @classmethod
+    def slant_path_zenith_terms(self, f, rho, P, T):
+        # Specific attenuations and equivalent heights used by the
+        # approximate slant path method
+        gamma0 = self.gamma0_exact(f, P, rho, T)
+        gammaw = self.gammaw_exact(f, P, rho, T)
+        h0, hw = self.slant_inclined_path_equivalent_height(f, P, rho, T)
+        return gamma0, gammaw, h0, hw
+
     @classmethod
     def gaseous_attenuation_slant_path(self, f, el, rho, P, T, V_t=None,
                                        h=None, mode='approx'):
         """
         """
         if mode == 'approx':
-            gamma0, gammaw = self.gaseous_attenuation_approximation(
-                f, el, rho, P, T)
-
-            h0, hw = self.slant_inclined_path_equivalent_height(f, P, rho, T)
+            __approximation_warnings__(f, el)
+            gamma0, gammaw, h0, hw = __slant_path_zenith_terms__(
+                self, f, rho, P, T)
 
             # Use the zenit water-vapour method if the values of V_t
             # and h are provided
@@ -385,35 +466,7 @@ class _ITU676_12_():
             return (A0 + Aw) / np.sin(np.deg2rad(el))
 
         else:
-            delta_h = 0.0001 * \
-                np.exp((np.arange(0, 922)) / 100)             # Eq. 14
-            h_n = 0.0001 * ((np.exp(np.arange(0, 922) / 100.0) -
-                             1.0) / (np.exp(1.0 / 100.0) - 1.0))             # Eq. 15
-            T_n = standard_temperature(h_n).to(u.K).value
-            press_n = standard_pressure(h_n).value
-            rho_n = standard_water_vapour_density(h_n, rho_0=rho).value
-
-            e_n = rho_n * T_n / 216.7
-            n_n = radio_refractive_index(press_n, e_n, T_n).value
-            n_ratio = n_n / np.pad(n_n[1:], (0, 1), mode='edge')
-            r_n = 6371 + h_n
-
-            b = np.pi / 2 - np.deg2rad(el)
-            Agas = 0
-            for t, press, rho, r, delta, n_r in zip(
-                    T_n, press_n, rho_n, r_n, delta_h, n_ratio):
-                a = - r * np.cos(b) + 0.5 * np.sqrt(
-                    4 * r**2 * np.cos(b)**2 + 8 * r * delta + 4 * delta**2)  # Eq. 17
-                a_cos_arg = np.clip((-a**2 - 2 * r * delta - delta**2) /
-                                    (2 * a * r + 2 * a * delta), -1, 1)
-                # Eq. 18a
-                alpha = np.pi - np.arccos(a_cos_arg)
-                gamma = self.gamma_exact(f, press, rho, t)
-                Agas += a * gamma                                            # Eq. 13
-                b = np.arcsin(np.sin(alpha) *
-                              n_r)                           # Eq. 19a
-
-            return Agas
+            return __gaseous_attenuation_slant_path_exact__(self, f, el, rho)
 
     @classmethod
     def gaseous_attenuation_inclined_path(
@@ -488,37 +541,21 @@ class _ITU676_12_():
         b = 8.741e4 * np.exp(-0.587 * f) + 312.2 * f**(-2.38) + 0.723
         h = np.clip(h, 0, 4)
 
-        gammaw_approx_vect = np.vectorize(self.gammaw_exact)
+        # gammaw is evaluated at f and f_ref in a single call, with both
+        # frequencies stacked along a new leading axis
+        f_pair = np.stack(np.broadcast_arrays(f, f_ref, rho_ref)[:2])
+        gammaw = self.gammaw_exact(f_pair, p_ref, rho_ref, t_ref + 273.15)
 
-        Aw_term1 = (0.0176 * V_t *
-                    gammaw_approx_vect(f, p_ref, rho_ref, t_ref + 273.15) /
-                    gammaw_approx_vect(f_ref, p_ref, rho_ref, t_ref + 273.15))
+        Aw_term1 = 0.0176 * V_t * gammaw[0] / gammaw[1]
 
         return np.where(f < 20, Aw_term1, Aw_term1 * (a * h ** b + 1))
 
 
 class _ITU676_11_():
 
-    tmp = load_data(os.path.join(dataset_dir, '676/v11_lines_oxygen.txt'),
-                    skip_header=1)
-    f_ox = tmp[:, 0]
-    a1 = tmp[:, 1]
-    a2 = tmp[:, 2]
-    a3 = tmp[:, 3]
-    a4 = tmp[:, 4]
-    a5 = tmp[:, 5]
-    a6 = tmp[:, 6]
-
-    tmp = load_data(os.path.join(dataset_dir,
-                                 '676//v11_lines_water_vapour.txt'),
-                    skip_header=1)
-    f_wv = tmp[:, 0]
-    b1 = tmp[:, 1]
-    b2 = tmp[:, 2]
-    b3 = tmp[:, 3]
-    b4 = tmp[:, 4]
-    b5 = tmp[:, 5]
-    b6 = tmp[:, 6]
+    f_ox, a1, a2, a3, a4, a5, a6 = __load_lines__('v11_lines_oxygen.txt')
+    f_wv, b1, b2, b3, b4, b5, b6 = __load_lines__(
+        'v11_lines_water_vapour.txt')
 
     idx_approx = np.zeros_like(b1, dtype=bool).squeeze()
     asterisk_rows = [0, 3, 4, 5, 7, 12, 20, 24, 34]
@@ -535,6 +572,8 @@ class _ITU676_11_():
         # T in Kelvin
         # e : water vapour partial pressure in hPa (total barometric pressure
         # ptot = p + e)
+        # The spectral lines are placed along an additional trailing axis
+        f, p, rho, T = (np.asarray(x)[..., np.newaxis] for x in (f, p, rho, T))
         theta = 300 / T
         e = rho * T / 216.7
 
@@ -549,16 +588,16 @@ class _ITU676_11_():
         D_f_wv = b3 * 1e-4 * (p * theta ** b4 +
                               b5 * e * theta ** b6)
 
-        F_i_wv = f / f_wv * ((D_f_wv) / ((f_wv - f)**2 + D_f_wv**2) +
-                             (D_f_wv) / ((f_wv + f)**2 + D_f_wv**2))
+        D_f_wv_2 = D_f_wv**2
 
-        Si_wv = b1 * 1e-1 * e * theta**3.5 * np.exp(b2 * (1 - theta))
+        F_i_wv = f / f_wv * (D_f_wv / ((f_wv - f)**2 + D_f_wv_2) +
+                             D_f_wv / ((f_wv + f)**2 + D_f_wv_2))
 
-        N_pp_wv = Si_wv * F_i_wv
+        Si_wv = b1 * 1e-1 * e * theta**3.5 * np.exp(b2 * (1 - theta))
 
-        N_pp = N_pp_wv.sum()
+        N_pp = np.einsum('...i,...i->...', Si_wv, F_i_wv)
 
-        gamma = 0.1820 * f * N_pp           # Eq. 1 [dB/km]
+        gamma = 0.1820 * f[..., 0] * N_pp   # Eq. 1 [dB/km]
         return gamma
 
     @classmethod
@@ -566,34 +605,38 @@ class _ITU676_11_():
         # T in Kelvin
         # e : water vapour partial pressure in hPa (total barometric pressure
         # ptot = p + e)
+        # The spectral lines are placed along an additional trailing axis
+        f, p, rho, T = (np.asarray(x)[..., np.newaxis] for x in (f, p, rho, T))
         theta = 300 / T
+        theta_08 = theta**0.8
         e = rho * T / 216.7
 
         f_ox = self.f_ox
+        f_minus = f_ox - f
+        f_plus = f_ox + f
 
-        D_f_ox = self.a3 * 1e-4 * (p * (theta ** (0.8 - self.a4)) +
+        D_f_ox = self.a3 * 1e-4 * (p * theta ** (0.8 - self.a4) +
                                    1.1 * e * theta)
+        D_f_ox_2 = D_f_ox**2
 
-        delta_ox = (self.a5 + self.a6 * theta) * 1e-4 * (p + e) * theta**0.8
+        delta_ox = (self.a5 + self.a6 * theta) * 1e-4 * (p + e) * theta_08
 
-        F_i_ox = f / f_ox * ((D_f_ox - delta_ox * (f_ox - f)) /
-                             ((f_ox - f) ** 2 + D_f_ox ** 2) +
-                             (D_f_ox - delta_ox * (f_ox + f)) /
-                             ((f_ox + f) ** 2 + D_f_ox ** 2))
+        F_i_ox = f / f_ox * ((D_f_ox - delta_ox * f_minus) /
+                             (f_minus ** 2 + D_f_ox_2) +
+                             (D_f_ox - delta_ox * f_plus) /
+                             (f_plus ** 2 + D_f_ox_2))
 
         Si_ox = self.a1 * 1e-7 * p * theta**3 * np.exp(self.a2 * (1 - theta))
 
-        N_pp_ox = Si_ox * F_i_ox
-
-        d = 5.6e-4 * (p + e) * theta**0.8
+        d = 5.6e-4 * (p + e) * theta_08
 
         N_d_pp = f * p * theta**2 * \
             (6.14e-5 / (d * (1 + (f / d)**2)) +
              1.4e-12 * p * theta**1.5 / (1 + 1.9e-5 * f**1.5))
 
-        N_pp = N_pp_ox.sum() + N_d_pp
+        N_pp = np.einsum('...i,...i->...', Si_ox, F_i_ox) + N_d_pp[..., 0]
 
-        gamma = 0.1820 * f * N_pp           # Eq. 1 [dB/km]
+        gamma = 0.1820 * f[..., 0] * N_pp   # Eq. 1 [dB/km]
         return gamma
 
     @classmethod
@@ -614,20 +657,7 @@ class _ITU676_11_():
         """
         T goes in Kelvin
         """
-        if np.any(f > 350):
-            warnings.warn(
-                RuntimeWarning(
-                    'The approximated method to computes '
-                    'the gaseous attenuation in recommendation ITU-P 676-11 '
-                    'is only recommended for frequencies below 350GHz'))
-
-        if np.any(5 > el) or np.any(np.mod(el, 90) < 5):
-            warnings.warn(
-                RuntimeWarning(
-                    'The approximated method to compute '
-                    'the gaseous attenuation in recommendation ITU-P 676-11 '
-                    'is only recommended for elevation angles between '
-                    '5 and 90 degrees'))
+        __approximation_warnings__(f, el)
 
         # Water vapour attenuation (gammaw) computation as in Section 1 of
         # Annex 2 of [1]
@@ -645,9 +675,10 @@ class _ITU676_11_():
             np.exp(- ((f - 59.7) / (2.87 + 12.4 * np.exp(-7.9 * rp)))**2)
         t2 = (0.14 * np.exp(2.12 * rp)) / \
             ((f - 118.75)**2 + 0.031 * np.exp(2.2 * rp))
+        # The polynomials in f are evaluated using Horner's scheme
         t3 = 0.0114 / (1 + 0.14 * rp**-2.6) * f * \
-            (-0.0247 + 0.0001 * f + 1.61e-6 * f**2) / \
-            (1 - 0.0169 * f + 4.1e-5 * f**2 + 3.2e-7 * f**3)
+            (-0.0247 + (0.0001 + 1.61e-6 * f) * f) / \
+            (1 + (-0.0169 + (4.1e-5 + 3.2e-7 * f) * f) * f)
 
         h0 = 6.1 / (1 + 0.17 * rp**-1.1) * (1 + t1 + t2 + t3)
 
@@ -675,17 +706,25 @@ class _ITU676_11_():
             gamma = self.gamma_exact(f, P, rho, T)
             return gamma * r
 
+    @classmethod
+    def slant_path_zenith_terms(self, f, rho, P, T):
+        # Specific attenuations and equivalent heights used by the
+        # approximate slant path method
+        gamma0 = self.gamma0_approx(f, P, rho, T)
+        gammaw = self.gammaw_approx(f, P, rho, T)
+        e = rho * T / 216.7
+        h0, hw = self.slant_inclined_path_equivalent_height(f, P + e)
+        return gamma0, gammaw, h0, hw
+
     @classmethod
     def gaseous_attenuation_slant_path(self, f, el, rho, P, T, V_t=None,
                                        h=None, mode='approx'):
         """
         """
         if mode == 'approx':
-            gamma0, gammaw = self.gaseous_attenuation_approximation(
-                f, el, rho, P, T)
-
-            e = rho * T / 216.7
-            h0, hw = self.slant_inclined_path_equivalent_height(f, P + e)
+            __approximation_warnings__(f, el)
+            gamma0, gammaw, h0, hw = __slant_path_zenith_terms__(
+                self, f, rho, P, T)
 
             # Use the zenit water-vapour method if the values of V_t
             # and h are provided
@@ -699,35 +738,7 @@ class _ITU676_11_():
             return (A0 + Aw) / np.sin(np.deg2rad(el))
 
         else:
-            delta_h = 0.0001 * \
-                np.exp((np.arange(0, 922)) / 100)             # Eq. 21
-            h_n = 0.0001 * ((np.exp(np.arange(0, 922) / 100.0) -
-                             1.0) / (np.exp(1.0 / 100.0) - 1.0))
-            T_n = standard_temperature(h_n).to(u.K).value
-            press_n = standard_pressure(h_n).value
-            rho_n = standard_water_vapour_density(h_n, rho_0=rho).value
-
-            e_n = rho_n * T_n / 216.7
-            n_n = radio_refractive_index(press_n, e_n, T_n).value
-            n_ratio = n_n / np.pad(n_n[1:], (0, 1), mode='edge')
-            r_n = 6371 + h_n
-
-            b = np.pi / 2 - np.deg2rad(el)
-            Agas = 0
-            for t, press, rho, r, delta, n_r in zip(
-                    T_n, press_n, rho_n, r_n, delta_h, n_ratio):
-                a = - r * np.cos(b) + 0.5 * np.sqrt(
-                    4 * r**2 * np.cos(b)**2 + 8 * r * delta + 4 * delta**2)  # Eq. 17
-                a_cos_arg = np.clip((-a**2 - 2 * r * delta - delta**2) /
-                                    (2 * a * r + 2 * a * delta), -1, 1)
-                # Eq. 18
-                alpha = np.pi - np.arccos(a_cos_arg)
-                gamma = self.gamma_exact(f, press, rho, t)
-                Agas += a * gamma                                            # Eq. 20
-                b = np.arcsin(np.sin(alpha) *
-                              n_r)                           # Eq. 19
-
-            return Agas
+            return __gaseous_attenuation_slant_path_exact__(self, f, el, rho)
 
     @classmethod
     def gaseous_attenuation_inclined_path(
@@ -802,37 +813,54 @@ class _ITU676_11_():
         b = 8.741e4 * np.exp(-0.587 * f) + 312.2 * f**(-2.38) + 0.723
         h = np.minimum(h, 4)
 
-        gammaw_approx_vect = np.vectorize(self.gammaw_approx)
+        # gammaw is evaluated at f and f_ref in a single call, with both
+        # frequencies stacked along a new leading axis
+        f_pair = np.stack(np.broadcast_arrays(f, f_ref, rho_ref)[:2])
+        gammaw = self.gammaw_approx(f_pair, p_ref, rho_ref, t_ref + 273.15)
 
-        Aw_term1 = (0.0176 * V_t *
-                    gammaw_approx_vect(f, p_ref, rho_ref, t_ref + 273.15) /
-                    gammaw_approx_vect(f_ref, p_ref, rho_ref, t_ref + 273.15))
+        Aw_term1 = 0.0176 * V_t * gammaw[0] / gammaw[1]
 
         return np.where(f < 20, Aw_term1, Aw_term1 * (a * h ** b + 1))
 
 
 class _ITU676_10_():
 
-    tmp = load_data(os.path.join(dataset_dir, '676/v10_lines_oxygen.txt'),
-                    skip_header=1)
-    f_ox = tmp[:, 0]
-    a1 = tmp[:, 1]
-    a2 = tmp[:, 2]
-    a3 = tmp[:, 3]
-    a4 = tmp[:, 4]
-    a5 = tmp[:, 5]
-    a6 = tmp[:, 6]
-
-    tmp = load_data(os.path.join(dataset_dir,
-                                 '676//v10_lines_water_vapour.txt'),
-                    skip_header=1)
-    f_wv = tmp[:, 0]
-    b1 = tmp[:, 1]
-    b2 = tmp[:, 2]
-    b3 = tmp[:, 3]
-    b4 = tmp[:, 4]
-    b5 = tmp[:, 5]
-    b6 = tmp[:, 6]
+    f_ox, a1, a2, a3, a4, a5, a6 = __load_lines__('v10_lines_oxygen.txt')
+    f_wv, b1, b2, b3, b4, b5, b6 = __load_lines__(
+        'v10_lines_water_vapour.txt')
+
+    # Coefficients of the water vapour lines in Eq. 23b, (a, f_i, b, c, f_g)
+    # where each term of the sum is:
+    #     a * eta * exp(c * (1 - rt)) / ((f - f_i)**2 + b * eta**2) * g(f, f_g)
+    # and f_g = 0 for the lines without the factor g
+    gammaw_approx_coeffs = np.array([(3.98, 22.235, 9.42, 2.23, 22.0),
+                                     (11.96, 183.310, 11.14, 0.70, 0),
+                                     (0.081, 321.226, 6.29, 6.44, 0),
+                                     (3.660, 325.153, 9.22, 1.60, 0),
+                                     (25.37, 380.000, 0, 1.09, 0),
+                                     (17.40, 448.000, 0, 1.46, 0),
+                                     (844.6, 557.000, 0, 0.17, 557.0),
+                                     (290.0, 752.000, 0, 0.41, 752.0),
+                                     (8.3328e4, 1780.00, 0, 0.99, 1780.0)])
+
+    # Coefficients (k, a, b, c, d) of the functions phi in Section 1 of Annex 2
+    # for delta, xi1 to xi7 and gamma54 to gamma66, in this order, where
+    #     k * phi = k * rp**a * rt**b * exp(c * (1 - rp) + d * (1 - rt))
+    gamma0_approx_coeffs = np.array([
+        (-0.00306, 3.211, -14.94, 1.583, -16.37),
+        (1, 0.0717, -1.8132, 0.0156, -1.6515),
+        (1, 0.5146, -4.6368, -0.1921, -5.7416),
+        (1, 0.3414, -6.5851, 0.2130, -8.5854),
+        (1, -0.0112, 0.0092, -0.1033, -0.0009),
+        (1, 0.2705, -2.7192, -0.3016, -4.1033),
+        (1, 0.2445, -5.9191, 0.0422, -8.0719),
+        (1, -0.1833, 6.5589, -0.2402, 6.131),
+        (2.192, 1.8286, -1.9487, 0.4051, -2.8509),
+        (12.59, 1.0045, 3.5610, 0.1588, 1.2834),
+        (15.00, 0.9003, 4.1335, 0.0427, 1.6088),
+        (14.28, 0.9886, 3.4176, 0.1827, 1.3429),
+        (6.819, 1.4320, 0.6258, 0.3177, -0.5914),
+        (1.908, 2.0717, -4.1404, 0.4910, -4.8718)])
 
     def __init__(self):
         self.__version__ = 10
@@ -842,61 +870,60 @@ class _ITU676_10_():
 
     @classmethod
     def gammaw_approx(self, f, P, rho, T):
-        rp = P / 1013
-        rt = 288 / (T)
+        rp = P / 1013.0
+        rt = 288.0 / (T)
+        return self.gammaw_approx_terms(f, rho, rp, rt)
+
+    @classmethod
+    def gammaw_approx_terms(self, f, rho, rp, rt):
+        # Water vapour attenuation as a function of the normalized pressure
+        # and temperature, which are shared with the dry air attenuation.
+        # The water vapour lines are placed along an additional trailing axis
+        f, rho, rp, rt = (np.asarray(x)[..., np.newaxis]
+                          for x in (f, rho, rp, rt))
         eta1 = 0.955 * rp * rt**0.68 + 0.006 * rho
         eta2 = 0.735 * rp * rt**0.50 + 0.0353 * rt**4 * rho
 
-        def g(f, fi): return 1 + ((f - fi) / (f + fi))**2
+        a, f_i, b, c, f_g = self.gammaw_approx_coeffs.T
+
+        # Only the line at 1780 GHz uses eta2, and only the lines with a
+        # non-zero f_g are multiplied by the factor g(f, f_g)
+        eta = np.where(f_i < 1780, eta1, eta2)
+        g = np.where(f_g > 0, 1 + ((f - f_g) / (f + f_g))**2, 1)
+
         gammaw = (
-            (3.98 * eta1 * np.exp(2.23 * (1 - rt))) /
-            ((f - 22.235) ** 2 + 9.42 * eta1 ** 2) * g(f, 22.0) +
-            (11.96 * eta1 * np.exp(0.70 * (1 - rt))) /
-            ((f - 183.310) ** 2 + 11.14 * eta1 ** 2) +
-            (0.081 * eta1 * np.exp(6.44 * (1 - rt))) /
-            ((f - 321.226) ** 2 + 6.29 * eta1 ** 2) +
-            (3.660 * eta1 * np.exp(1.60 * (1 - rt))) /
-            ((f - 325.153) ** 2 + 9.22 * eta1 ** 2) +
-            (25.37 * eta1 * np.exp(1.09 * (1 - rt))) / ((f - 380.000) ** 2) +
-            (17.40 * eta1 * np.exp(1.46 * (1 - rt))) / ((f - 448.000) ** 2) +
-            (844.6 * eta1 * np.exp(0.17 * (1 - rt))) / ((f - 557.000) ** 2) *
-            g(f, 557.0) + (290.0 * eta1 * np.exp(0.41 * (1 - rt))) /
-            ((f - 752.000) ** 2) * g(f, 752.0) +
-            (8.3328e4 * eta2 * np.exp(0.99 * (1 - rt))) /
-            ((f - 1780.00) ** 2) *
-            g(f, 1780.0)) * f ** 2 * rt ** 2.5 * rho * 1e-4
+            ((a * eta * np.exp(c * (1 - rt))) /
+             ((f - f_i) ** 2 + b * eta ** 2) * g).sum(axis=-1) *
+            (f ** 2 * rt ** 2.5 * rho)[..., 0] * 1e-4)
         return gammaw
 
     @classmethod
     def gamma0_approx(self, f, P, rho, T):
         rp = P / 1013.0
         rt = 288.0 / (T)
+        return self.gamma0_approx_terms(f, rp, rt)
 
-        def phi(rp, rt, a, b, c, d): return (
-            rp**a * np.power(rt, b) * np.exp(c * (1 - rp) + d * (1 - rt)))
-
+    @classmethod
+    def gamma0_approx_terms(self, f, rp, rt):
         # Dry air attenuation (gamma0) computation as in Section 1 of Annex 2
-        # of [1]
-        delta = -0.00306 * phi(rp, rt, 3.211, -14.94, 1.583, -16.37)
-
-        xi1 = phi(rp, rt, 0.0717, -1.8132, 0.0156, -1.6515)
-        xi2 = phi(rp, rt, 0.5146, -4.6368, -0.1921, -5.7416)
-        xi3 = phi(rp, rt, 0.3414, -6.5851, 0.2130, -8.5854)
-        xi4 = phi(rp, rt, -0.0112, 0.0092, -0.1033, -0.0009)
-        xi5 = phi(rp, rt, 0.2705, -2.7192, -0.3016, -4.1033)
-        xi6 = phi(rp, rt, 0.2445, -5.9191, 0.0422, -8.0719)
-        xi7 = phi(rp, rt, -0.1833, 6.5589, -0.2402, 6.131)
-
-        gamma54 = 2.192 * phi(rp, rt, 1.8286, -1.9487, 0.4051, -2.8509)
-        gamma58 = 12.59 * phi(rp, rt, 1.0045, 3.5610, 0.1588, 1.2834)
-        gamma60 = 15.00 * phi(rp, rt, 0.9003, 4.1335, 0.0427, 1.6088)
-        gamma62 = 14.28 * phi(rp, rt, 0.9886, 3.4176, 0.1827, 1.3429)
-        gamma64 = 6.819 * phi(rp, rt, 1.4320, 0.6258, 0.3177, -0.5914)
-        gamma66 = 1.908 * phi(rp, rt, 2.0717, -4.1404, 0.4910, -4.8718)
+        # of [1]. All the functions phi are evaluated at once along an
+        # additional trailing axis
+        k, a, b, c, d = self.gamma0_approx_coeffs.T
+        rp_, rt_ = (np.asarray(x)[..., np.newaxis] for x in (rp, rt))
+        phi = k * rp_**a * rt_**b * np.exp(c * (1 - rp_) + d * (1 - rt_))
+        (delta, xi1, xi2, xi3, xi4, xi5, xi6, xi7,
+         gamma54, gamma58, gamma60, gamma62, gamma64,
+         gamma66) = np.moveaxis(phi, -1, 0)
+
+        # The expressions of all the frequency ranges are evaluated for every
+        # frequency, so the bases of the non-integer powers are replaced by 1
+        # outside of the range where they are used to avoid invalid values
+        f_54 = np.where(f <= 54, 54 - f, 1.0)
+        f_66 = np.where(f >= 66, f - 66, 1.0)
 
         def fcn_le_54():
             return (((7.2 * rt**2.8) / (f**2 + 0.34 * rp**2 * rt**1.6) +
-                     (0.62 * xi3) / ((54 - f)**(1.16 * xi1) + 0.83 * xi2)) *
+                     (0.62 * xi3) / (f_54**(1.16 * xi1) + 0.83 * xi2)) *
                     f**2 * rp**2 * 1e-3)
 
         def fcn_le_60():
@@ -916,7 +943,7 @@ class _ITU676_10_():
             return ((3.02e-4 * rt**3.5 + (0.283 * rt**3.8) /
                      ((f - 118.75)**2 + 2.91 * rp**2 * rt**1.6) +
                      (0.502 * xi6 * (1 - 0.0163 * xi7 * (f - 66))) /
-                     ((f - 66)**(1.4346 * xi4) + 1.15 * xi5)) *
+                     (f_66**(1.4346 * xi4) + 1.15 * xi5)) *
                     f**2 * rp**2 * 1e-3)
 
         def fcn_rest():
@@ -925,20 +952,11 @@ class _ITU676_10_():
                                           2.91 * rp**2 * rt**1.6)) *
                     f**2 * rp**2 * rt**3.5 * 1e-3 + delta)
 
-        with np.errstate(invalid='ignore'):
-            gamma0 = \
-                np.where(
-                    f <= 54, fcn_le_54(),
-                    np.where(
-                        np.logical_and(54 < f, f <= 60), fcn_le_60(),
-                        np.where(
-                            np.logical_and(60 < f, f <= 62), fcn_le_62(),
-                            np.where(
-                                np.logical_and(62 < f, f <= 66), fcn_le_66(),
-                                np.where(
-                                    np.logical_and(66 < f, f <= 120),
-                                    fcn_le_120(),
-                                    fcn_rest())))))
+        # The first range that contains the frequency is selected
+        gamma0 = np.select(
+            [f <= 54, f <= 60, f <= 62, f <= 66, f <= 120],
+            [fcn_le_54(), fcn_le_60(), fcn_le_62(), fcn_le_66(), fcn_le_120()],
+            default=fcn_rest())
 
         return gamma0
 
@@ -960,25 +978,17 @@ class _ITU676_10_():
         """
         T goes in Kelvin
         """
-        if np.any(f > 350):
-            warnings.warn(
-                RuntimeWarning(
-                    'The approximated method to computes '
-                    'the gaseous attenuation in recommendation ITU-P 676-11 '
-                    'is only recommended for frequencies below 350GHz'))
-
-        if np.any(5 > el) or np.any(np.mod(el, 90) < 5):
-            warnings.warn(
-                RuntimeWarning(
-                    'The approximated method to compute '
-                    'the gaseous attenuation in recommendation ITU-P 676-11 '
-                    'is only recommended for elevation angles between '
-                    '5 and 90 degrees'))
+        __approximation_warnings__(f, el)
+
+        # The normalized pressure and temperature are computed only once for
+        # the dry air and water vapour attenuations
+        rp = P / 1013.0
+        rt = 288.0 / (T)
 
         # Water vapour attenuation (gammaw) computation as in Section 1 of
         # Annex 2 of [1]
-        gamma0 = self.gamma0_approx(f, P, rho, T)
-        gammaw = self.gammaw_approx(f, P, rho, T)
+        gamma0 = self.gamma0_approx_terms(f, rp, rt)
+        gammaw = self.gammaw_approx_terms(f, rho, rp, rt)
 
         return gamma0, gammaw
 
@@ -991,9 +1001,10 @@ class _ITU676_10_():
             np.exp(- ((f - 59.7) / (2.87 + 12.4 * np.exp(-7.9 * rp)))**2)
         t2 = (0.14 * np.exp(2.21 * rp)) / \
             ((f - 118.75)**2 + 0.031 * np.exp(2.2 * rp))
+        # The polynomials in f are evaluated using Horner's scheme
         t3 = (0.0114) / (1 + 0.14 * rp**-2.6) * f * \
-             (-0.0247 + 0.0001 * f + 1.61e-6 * f**2) / \
-             (1 - 0.0169 * f + 4.1e-5 * f**2 + 3.2e-7 * f**3)
+             (-0.0247 + (0.0001 + 1.61e-6 * f) * f) / \
+             (1 + (-0.0169 + (4.1e-5 + 3.2e-7 * f) * f) * f)
 
         h0 = (6.1) / (1 + 0.17 * rp**-1.1) * (1 + t1 + t2 + t3)
 
@@ -1021,16 +1032,28 @@ class _ITU676_10_():
             gamma = self.gamma_exact(f, P, rho, T)
             return gamma * r
 
+    @classmethod
+    def slant_path_zenith_terms(self, f, rho, P, T):
+        # Specific attenuations and equivalent heights used by the
+        # approximate slant path method. The normalized pressure and
+        # temperature are computed only once for both specific attenuations
+        rp = P / 1013.0
+        rt = 288.0 / (T)
+        gamma0 = self.gamma0_approx_terms(f, rp, rt)
+        gammaw = self.gammaw_approx_terms(f, rho, rp, rt)
+        e = rho * T / 216.7
+        h0, hw = self.slant_inclined_path_equivalent_height(f, P + e)
+        return gamma0, gammaw, h0, hw
+
     @classmethod
     def gaseous_attenuation_slant_path(self, f, el, rho, P, T, V_t=None,
                                        h=None, mode='approx'):
         """
         """
         if mode == 'approx':
-            gamma0, gammaw = self.gaseous_attenuation_approximation(
-                f, el, rho, P, T)
-            e = rho * T / 216.7
-            h0, hw = self.slant_inclined_path_equivalent_height(f, P + e)
+            __approximation_warnings__(f, el)
+            gamma0, gammaw, h0, hw = __slant_path_zenith_terms__(
+                self, f, rho, P, T)
 
             # Use the zenit water-vapour method if the values of V_t
             # and h are provided
@@ -1044,35 +1067,7 @@ class _ITU676_10_():
             return (A0 + Aw) / np.sin(np.deg2rad(el))
 
         else:
-            delta_h = 0.0001 * \
-                np.exp((np.arange(0, 922)) / 100)             # Eq. 21
-            h_n = 0.0001 * ((np.exp(np.arange(0, 922) / 100.0) -
-                             1.0) / (np.exp(1.0 / 100.0) - 1.0))
-            T_n = standard_temperature(h_n).to(u.K).value
-            press_n = standard_pressure(h_n).value
-            rho_n = standard_water_vapour_density(h_n, rho_0=rho).value
-
-            e_n = rho_n * T_n / 216.7
-            n_n = radio_refractive_index(press_n, e_n, T_n).value
-            n_ratio = n_n / np.pad(n_n[1:], (0, 1), mode='edge')
-            r_n = 6371 + h_n
-
-            b = np.pi / 2 - np.deg2rad(el)
-            Agas = 0
-            for t, press, rho, r, delta, n_r in zip(
-                    T_n, press_n, rho_n, r_n, delta_h, n_ratio):
-                a = - r * np.cos(b) + 0.5 * np.sqrt(
-                    4 * r**2 * np.cos(b)**2 + 8 * r * delta + 4 * delta**2)  # Eq. 17
-                a_cos_arg = np.clip((-a**2 - 2 * r * delta - delta**2) /
-                                    (2 * a * r + 2 * a * delta), -1, 1)
-                # Eq. 18
-                alpha = np.pi - np.arccos(a_cos_arg)
-                gamma = self.gamma_exact(f, press, rho, t)
-                Agas += a * gamma                                            # Eq. 20
-                b = np.arcsin(np.sin(alpha) *
-                              n_r)                           # Eq. 19
-
-            return Agas
+            return __gaseous_attenuation_slant_path_exact__(self, f, el, rho)
 
     @classmethod
     def gaseous_attenuation_inclined_path(
@@ -1135,34 +1130,18 @@ class _ITU676_10_():
         rho_ref = V_t / 4     # [g/m3]
         t_ref = 14 * np.log(0.22 * V_t / 4) + 3    # [Celsius]
 
-        gammaw_approx_vect = np.vectorize(self.gammaw_approx)
-        return (0.0173 * V_t *
-                gammaw_approx_vect(f, p_ref, rho_ref, t_ref + 273) /
-                gammaw_approx_vect(f_ref, p_ref, rho_ref, t_ref + 273))
+        # gammaw is evaluated at f and f_ref in a single call, with both
+        # frequencies stacked along a new leading axis
+        f_pair = np.stack(np.broadcast_arrays(f, f_ref, rho_ref)[:2])
+        gammaw = self.gammaw_approx(f_pair, p_ref, rho_ref, t_ref + 273)
+        return 0.0173 * V_t * gammaw[0] / gammaw[1]
 
 
 class _ITU676_9_():
 
-    tmp = load_data(os.path.join(dataset_dir, '676//v9_lines_oxygen.txt'),
-                    skip_header=1)
-    f_ox = tmp[:, 0]
-    a1 = tmp[:, 1]
-    a2 = tmp[:, 2]
-    a3 = tmp[:, 3]
-    a4 = tmp[:, 4]
-    a5 = tmp[:, 5]
-    a6 = tmp[:, 6]
-
-    tmp = load_data(os.path.join(dataset_dir,
-                                 '676//v9_lines_water_vapour.txt'),
-                    skip_header=1)
-    f_wv = tmp[:, 0]
-    b1 = tmp[:, 1]
-    b2 = tmp[:, 2]
-    b3 = tmp[:, 3]
-    b4 = tmp[:, 4]
-    b5 = tmp[:, 5]
-    b6 = tmp[:, 6]
+    f_ox, a1, a2, a3, a4, a5, a6 = __load_lines__('v9_lines_oxygen.txt')
+    f_wv, b1, b2, b3, b4, b5, b6 = __load_lines__(
+        'v9_lines_water_vapour.txt')
 
     def __init__(self):
         self.__version__ = 9
@@ -1217,6 +1196,25 @@ class _ITU676_9_():
                 self.gammaw_exact(f, p, rho, T))
 
 
+# Versions of the recommendation that are implemented
+_ITU676_VERSIONS = {12: _ITU676_12_,
+                    11: _ITU676_11_,
+                    10: _ITU676_10_,
+                    9: _ITU676_9_}
+
+
+@lru_cache(maxsize=None)
+def __get_version_instance__(version):
+    # The instance of each version is created only once, and reused every
+    # time that version is activated again
+    try:
+        return _ITU676_VERSIONS[version]()
+    except KeyError:
+        raise ValueError(
+            f"Version {version} is not implemented for the ITU-R P.676 model."
+        ) from None
+
+
 __model = __ITU676__()
 
 
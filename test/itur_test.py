@@ -27,6 +27,18 @@ def suite():
     suite.addTest(TestFunctionsRecommendation530('test_530'))
     suite.addTest(TestFunctionsRecommendation618('test_618'))
     suite.addTest(TestFunctionsRecommendation676('test_676'))
+    suite.addTest(TestFunctionsRecommendation676(
+        'test_676_terrestrial_path_length'))
+    suite.addTest(TestFunctionsRecommendation676(
+        'test_676_slant_path_frequency_array'))
+    suite.addTest(TestFunctionsRecommendation676(
+        'test_676_slant_path_exact_elevation_array'))
+    suite.addTest(TestFunctionsRecommendation676(
+        'test_676_slant_path_exact_0d_inputs'))
+    suite.addTest(TestFunctionsRecommendation676(
+        'test_676_equivalent_height_frequency_array'))
+    suite.addTest(TestFunctionsRecommendation676(
+        'test_676_equivalent_height_array_inputs'))
     suite.addTest(TestFunctionsRecommendation835('test_835'))
     suite.addTest(TestFunctionsRecommendation836('test_836'))
     suite.addTest(TestFunctionsRecommendation837('test_837'))
@@ -737,6 +749,97 @@ class TestFunctionsRecommendation676(test.TestCase):
             self.test_all_functions_676()
             self.assertEqual(models.itu676.get_version(), version)
 
+    def test_676_terrestrial_path_length(self):
+        f = 29 * itur.u.GHz
+        el = 71
+        rho = 7.5
+        P = 1013 * itur.u.hPa
+        T = 15 * itur.u.deg_C
+
+        for version in self.versions:
+            models.itu676.change_version(version)
+            for mode in ['approx', 'exact']:
+                A_1 = models.itu676.gaseous_attenuation_terrestrial_path(
+                    1 * itur.u.km, f, el, rho, P, T, mode)
+                A_5 = models.itu676.gaseous_attenuation_terrestrial_path(
+                    5000 * itur.u.m, f, el, rho, P, T, mode)
+                np.testing.assert_allclose(A_5.value, 5 * A_1.value)
+
+    def test_676_slant_path_frequency_array(self):
+        f = np.array([10., 30.])
+        el = 30.
+        rho = 7.5
+        P = 1013.
+        T = 288.
+
+        for model in [models.itu676._ITU676_9_, models.itu676._ITU676_10_,
+                      models.itu676._ITU676_11_, models.itu676._ITU676_12_]:
+            A = model.gaseous_attenuation_slant_path(f, el, rho, P, T)
+            A_i = [model.gaseous_attenuation_slant_path(f_i, el, rho, P, T)
+                   for f_i in f]
+            np.testing.assert_allclose(A, A_i)
+
+    def test_676_slant_path_exact_elevation_array(self):
+        f = 30.
+        el = np.array([10., 20., 30.])
+        rho = 7.5
+        P = 1013.
+        T = 288.
+
+        for model in [models.itu676._ITU676_9_, models.itu676._ITU676_10_,
+                      models.itu676._ITU676_11_, models.itu676._ITU676_12_]:
+            A = model.gaseous_attenuation_slant_path(
+                f, el, rho, P, T, mode='exact')
+            A_i = [model.gaseous_attenuation_slant_path(
+                f, el_i, rho, P, T, mode='exact') for el_i in el]
+            np.testing.assert_allclose(A, A_i)
+            A = model.gaseous_attenuation_slant_path(
+                f, list(el), rho, P, T, mode='exact')
+            np.testing.assert_allclose(A, A_i)
+
+    def test_676_slant_path_exact_0d_inputs(self):
+        for model in [models.itu676._ITU676_9_, models.itu676._ITU676_10_,
+                      models.itu676._ITU676_11_, models.itu676._ITU676_12_]:
+            A_0d = model.gaseous_attenuation_slant_path(
+                np.array(30.), 30., np.array(7.5), 1013., 288., mode='exact')
+            A = model.gaseous_attenuation_slant_path(
+                30., 30., 7.5, 1013., 288., mode='exact')
+            np.testing.assert_allclose(A_0d, A)
+
+    def test_676_equivalent_height_frequency_array(self):
+        f = [10, 22.235, 60, 69.9, 70, 100, 183.31]
+        P = 1013 * itur.u.hPa
+
+        for version in self.versions:
+            models.itu676.change_version(version)
+            h0, hw = models.itu676.slant_inclined_path_equivalent_height(f, P)
+            for i, f_i in enumerate(f):
+                h0_i, hw_i = \
+                    models.itu676.slant_inclined_path_equivalent_height(f_i, P)
+                np.testing.assert_allclose(h0[i].value, h0_i.value)
+                np.testing.assert_allclose(hw[i].value, hw_i.value)
+
+    def test_676_equivalent_height_array_inputs(self):
+        f = [10, 22.235, 60]
+        P = [1013, 900, 800] * itur.u.hPa
+        rho = [7.5, 5, 2.5] * itur.u.g / itur.u.m**3
+        T = [288, 280, 270] * itur.u.K
+
+        for version in self.versions:
+            models.itu676.change_version(version)
+            # Array pressures and water vapour densities are evaluated
+            # elementwise and the heights are returned as (h0, hw)
+            h = models.itu676.slant_inclined_path_equivalent_height(
+                f[1], P, rho)
+            self.assertEqual(h.shape, (2, 3))
+            h = models.itu676.slant_inclined_path_equivalent_height(
+                f, P, rho, T)
+            self.assertEqual(h.shape, (2, 3))
+            for i in range(3):
+                h_i = models.itu676.slant_inclined_path_equivalent_height(
+                    f[i], P[i], rho[i], T[i])
+                np.testing.assert_allclose(h[:, i].value, h_i.value)
+
 
 class TestFunctionsRecommendation835(test.TestCase):
     def setUp(self):